@@ -50,10 +50,10 @@ if __name__ == '__main__':
 
     # eliminate those which are duplicates and those which are in archives already
     submodules = set(submodules) - set(archives['git'])
-    submodules = sorted(list(submodules))
+    submodules = sorted(submodules)
 
     # TODO single dots are not yet resolved correctly, for example in https://github.com/henkboom/pax-britannica.git
-    submodules = [x for x in submodules if not any([x.startswith(y) for y in ('.', 'git@')])]
+    submodules = [x for x in submodules if not x.startswith(('.', 'git@'))]
 
     # store them
     print('found {} submodules'.format(len(submodules)))
@@ -83,7 +83,8 @@ def run_update(type, urls, type_folder=None):
     folders = [folder_name[type](url) for url in urls]
 
     # find those folders not used anymore
-    existing_folders = [x for x in os.listdir(base_folder) if os.path.isdir(os.path.join(base_folder, x))]
+    with os.scandir(base_folder) as it:
+        existing_folders = [x.name for x in it if x.is_dir()]
     unused_folders = [x for x in existing_folders if x not in folders]
     print('{} unused archives, move to unused folder'.format(len(unused_folders)))
     for folder in unused_folders:
@@ -8,6 +8,8 @@ import re
 from difflib import SequenceMatcher
 from utils.utils import *
 
+regex_parenthesized = re.compile(r' \([^)]*\)')
+
 
 def similarity(a, b):
     return SequenceMatcher(None, a, b).ratio()
@@ -26,7 +28,7 @@ if __name__ == "__main__":
     # extract game names
     data = data['data']
     data = (x[0] for x in data)
-    existing_names = list(re.sub(r' \([^)]*\)', '', x) for x in data)
+    existing_names = list(regex_parenthesized.sub('', x) if ' (' in x else x for x in data)
 
     # read names to test
     test_file = os.path.join(root_path, 'is_already_included.txt')
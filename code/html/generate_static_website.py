@@ -73,7 +73,6 @@ import shutil
 import math
 import datetime
 import time
-import json
 from functools import partial
 from utils import osg, constants as c, utils, osg_statistics as stat, osg_parse
 from jinja2 import Environment, FileSystemLoader
@@ -207,7 +206,7 @@ def file_hash(text):
     :return:
     """
     text = text.split('\n')
-    text = [t for t in text if not any(t.startswith(prefix) for prefix in ('  This website is built ', '    <dc:date>'))]
+    text = [t for t in text if not t.startswith(('  This website is built ', '    <dc:date>'))]
     text = ''.join(text)
     return hash(text)
 
@@ -301,7 +300,7 @@ def url_to(current, target, info=None):
     :return:
     """
     # if it's an absolute url, just return
-    if isinstance(target, str) and any(target.startswith(x) for x in ('http://', 'https://')):
+    if isinstance(target, str) and target.startswith(('http://', 'https://')):
         return target
     if isinstance(target, str):
         target = [target]
@@ -361,8 +360,9 @@ def entry_index(entry):
     tags = []
     if 'beta' in entry['State']:
         tags.append('beta')
-    if osg.is_inactive(entry):
-        tags.append('inactive since {}'.format(osg.extract_inactive_year(entry)))
+    inactive_year = osg.extract_inactive_year(entry)
+    if inactive_year is not None:
+        tags.append('inactive since {}'.format(inactive_year))
     if tags:
         e['tags'] = make_text('({})'.format(', '.join(tags)), 'is-light is-size-7')
     return e
@@ -910,9 +910,8 @@ def create_table_json_data(entries):
     db['data'] = data
 
     # write out
-    text = json.dumps(db, indent=1)
     os.makedirs(c.web_data_path, exist_ok=True)
-    utils.write_text(os.path.join(c.web_data_path, 'entries.json'), text)
+    utils.write_json(os.path.join(c.web_data_path, 'entries.json'), db)
 
 
 def create_statistics_section(entries, field, title, file_name, chartmaker, sub_field=None):
@@ -1286,7 +1285,7 @@ if __name__ == "__main__":
     print('estimate file hashes')
     for dirpath, dirnames, filenames in os.walk(c.web_path):
         for file in filenames:
-            if any(file.endswith(ext) for ext in ('.html', '.svg')):
+            if file.endswith(('.html', '.svg')):
                 file = os.path.join(dirpath, file)
                 text = utils.read_text(file)
                 previous_files[file] = {'hash': file_hash(text), 'text': text}
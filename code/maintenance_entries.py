@@ -32,11 +32,36 @@ Sorts the entries in the contents files of each sub folder alphabetically.
 import os
 import re
 import datetime
-import json
 import textwrap
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from operator import itemgetter
+from urllib.parse import urlsplit
 from utils import osg, osg_ui, osg_parse, utils, constants as c
 import requests
 
+# regex for finding urls (can be in <> or in ]() or after a whitespace), the whole match is the url
+regex_external_links = re.compile(r"(?<=[\s\n]<)http.+?(?=>)|(?<=\]\()http.+?(?=\))|(?<=[\s\n])http[^\s\n,]+?(?=[\s\n\)])")
+
+# regex for finding the urls of rejected entries (in parentheses)
+regex_rejected_urls = re.compile(r"\((http.*?)\)", re.MULTILINE)
+
+# regex for finding code hosted on popular sites (github, gitlab, bitbucket, sourceforge, launchpad)
+popular_code_repositories = ('github.com', 'gitlab.com', 'bitbucket.org', 'code.sf.net', 'code.launchpad.net')
+regex_popular_code_repositories = re.compile('|'.join(re.escape(x) for x in popular_code_repositories))
+
+# number of concurrently checked external links and maximal number of concurrent requests to the same host (many
+# hosts, e.g. github, rate limit), the latter is also the connection pool size per host (all connections kept alive)
+link_check_workers = 16
+link_check_requests_per_host = 4
+
+# markers of the autogenerated block in the readme
+readme_start_marker = '[comment]: # (start'
+readme_end_marker = 'end of autogenerated content)'
+
+# keywords of the non game categories in the readme (every entry without any of them is a game)
+toc_category_keywords = frozenset(('tool', 'framework', 'library'))
+
 
 def check_validity_backlog():
     import requests
@@ -61,9 +86,17 @@ def check_validity_backlog():
                 print('{} redirected to {}, {}'.format(url, r.url, r.history))
 
 
-def create_toc(title, file, entries):
+def toc_row(entry):
     """
+    Creates the row of an entry in a TOC file (title with link and some overview information).
+    """
+    info = entry['Code language'] + entry['Code license'] + entry['State']
+    return '- **[{}]({})** ({})'.format(entry['Title'], '../' + entry['File'], ', '.join(info))
+
 
+def create_toc(title, file, rows):
+    """
+    Writes a TOC file with a title and the given rows (see toc_row) sorted by title.
     """
     # file path
     toc_file = os.path.join(c.tocs_path, file)
@@ -71,14 +104,8 @@ def create_toc(title, file, entries):
     # header line
     text = '[comment]: # (autogenerated content, do not edit)\n# {}\n\n'.format(title)
 
-    # assemble rows
-    rows = []
-    for entry in entries:
-        info = entry['Code language'] + entry['Code license'] + entry['State']
-        rows.append('- **[{}]({})** ({})'.format(entry['Title'], '../' + entry['File'], ', '.join(info)))
-
     # sort rows (by title)
-    rows.sort(key=str.casefold)
+    rows = sorted(rows, key=str.casefold)
 
     # add to text
     text += '\n'.join(rows)
@@ -87,13 +114,109 @@ def create_toc(title, file, entries):
     utils.write_text(toc_file, text)
 
 
+def external_links(content, ignored_urls=()):
+    """
+    Extracts the external links of the content of an entry (slightly modified where needed to be checkable).
+    Returns the links without duplicates in the order of their appearance.
+    """
+    links = []
+    # apply regex, for each match
+    for match in regex_external_links.finditer(content):
+        url = match.group()
+        if url.startswith(ignored_urls):
+            continue
+
+        # ignore bzr.sourceforge, no web address found
+        if 'bzr.sourceforge.net/bzrroot/' in url:
+            continue
+
+        # add "/" at the end
+        if url.startswith((
+        'https://anongit.freedesktop.org/git', 'https://git.savannah.gnu.org/git/',
+        'https://git.savannah.nongnu.org/git/', 'https://git.artsoft.org/')):
+            url += '/'
+
+        if url.startswith('https://bitbucket.org/') and url.endswith('.git'):
+            url = url[:-4] + '/commits/'
+        if url.startswith('https://svn.code.sf.net/p/'):
+            url = 'http' + url[5:] + '/'
+        if url.startswith('http://cvs.savannah.nongnu.org:/sources/'):
+            url = 'http://cvs.savannah.nongnu.org/viewvc/' + url[40:] + '/'
+        if url.startswith('http://cvs.savannah.gnu.org:/sources/'):
+            url = 'http://cvs.savannah.gnu.org/viewvc/' + url[37:] + '/'
+
+        # generally ".git" at the end is not working well, except sometimes
+        if url.endswith('.git') and not url.startswith((
+        'https://repo.or.cz', 'https://git.tuxfamily.org/fanwor/fanwor')):
+            url = url[:-4]
+
+        links.append(url)
+    return list(dict.fromkeys(links))
+
+
+def check_external_links_in_turn(session, links, redirect_okay=()):
+    """
+    Checks a list of external links (tuples of url and entry names) one after the other (see check_external_link).
+    Returns a list of messages.
+    """
+    messages = []
+    for url, names in links:
+        messages.extend(check_external_link(session, url, names, redirect_okay))
+    return messages
+
+
+def check_external_link(session, url, names, redirect_okay=()):
+    """
+    Checks a single external link with a HEAD request (GET if HEAD is not supported) using a requests session.
+    Returns a list of messages (empty if the link is fine).
+    """
+    names = list(names)  # was a set
+    if len(names) == 1:
+        names = names[0]
+    messages = []
+    try:
+        verify = True
+        # some have an expired certificate but otherwise still work
+        if url.startswith((
+        'https://perso.b2b2c.ca/~sarrazip/dev/', 'https://dreerally.com/', 'https://henlin.net/',
+        'https://www.megamek.org/', 'https://pixeldoctrine.com/', 'https://gitorious.org/',
+        'https://www.opmon-game.ga/')):
+            verify = False
+        r = session.head(url, headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; WOW64)'}, timeout=20,
+                         allow_redirects=True, verify=verify)
+        if r.status_code == 405:  # head method not supported, try get
+            r = session.get(url, headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; WOW64)'},
+                            timeout=20, allow_redirects=True, verify=verify)
+        # check for bad status
+        if r.status_code != requests.codes.ok:
+            messages.append('{}: {} - {}'.format(names, url, r.status_code))
+        # check for redirect
+        if r.history and url not in redirect_okay:
+            # only / added or http->https sometimes
+            redirected_url = r.url
+            if redirected_url == url + '/':
+                output = '{}: {} -> {} - redirect "/" at end '
+            elif redirected_url == 'https' + url[4:]:
+                output = '{}: {} -> {} - redirect "https" at start'
+            else:
+                output = '{}: {} -> {} - redirect '
+            messages.append(output.format(names, url, redirected_url))
+    except Exception as e:
+        error_name = type(e).__name__
+        if error_name == 'SSLError' and url.startswith((
+        'https://gitorious.org/', 'https://www.freedroid.org/download/')):
+            return messages  # even though verify is False, these errors still get through
+        messages.append('{}: {} - exception {}'.format(names, url, error_name))
+    return messages
+
+
 def sort_text_file(file, name):
     """
     Reads a text file, splits in lines, removes duplicates, sort, writes back.
     """
     text = utils.read_text(file)
     text = text.split('\n')
-    text = sorted(list(set(text)), key=str.casefold)
+    text = sorted(set(text), key=str.casefold)
     print('{} contains {} items'.format(name, len(text)))
     text = '\n'.join(text)
     utils.write_text(file, text)
@@ -103,16 +226,28 @@ class EntriesMaintainer:
 
     def __init__(self):
         self.entries = None
+        self.contents = None
 
     def read_entries(self):
-        self.entries = osg.read_entries()
+        # keep the file contents, the checks working on the raw text can reuse them
+        self.contents = list(osg.entry_iterator())
+        self.entries = osg.read_entries(self.contents)
         print('{} entries read'.format(len(self.entries)))
 
+    def entry_contents(self):
+        """
+        Contents of the entry files as read together with the entries, otherwise reads them now.
+        """
+        if self.contents is None:
+            return osg.entry_iterator()
+        return self.contents
+
     def write_entries(self):
         if not self.entries:
             print('entries not yet loaded')
             return
         osg.write_entries(self.entries)
+        self.contents = None  # the files were rewritten
         print('entries written')
 
 
@@ -127,7 +262,7 @@ class EntriesMaintainer:
         check_strings = [x for x in text if x and not x.startswith('##')]
 
         # iterate over all entries
-        for _, entry_path, content in osg.entry_iterator():
+        for _, entry_path, content in self.entry_contents():
 
             for check_string in check_strings:
                 if content.find(check_string) >= 0:
@@ -158,7 +293,7 @@ class EntriesMaintainer:
         for index, name in enumerate(unique_keywords):
             for other_index in range(index+1, len(unique_keywords)):
                 other_name = unique_keywords[other_index]
-                if osg.name_similarity(name, other_name) > 0.8:
+                if osg.names_are_similar(name, other_name, 0.8):
                     print(' Keywords {} ({}) - {} ({}) are similar'.format(name, unique_keywords_counts[index], other_name, unique_keywords_counts[other_index]))
 
         # get all names of frameworks and library also using osg.code_dependencies_aliases
@@ -185,7 +320,7 @@ class EntriesMaintainer:
         referenced_dependencies = [(k, v) for k, v in referenced_dependencies.items() if k not in valid_dependencies]
 
         # sort by number
-        referenced_dependencies.sort(key=lambda x: x[1], reverse=True)
+        referenced_dependencies.sort(key=itemgetter(1), reverse=True)
 
         # print out
         print('Code dependencies not included as entry')
@@ -224,7 +359,7 @@ class EntriesMaintainer:
         for entry in self.entries:
             name = entry['File']
             title = entry['Title']
-            if title[0] == 'j' and title[1] == title[1].upper() and not 'Java' in entry['Code language']:
+            if title.startswith('j') and title[1:2] == title[1:2].upper() and not 'Java' in entry['Code language']:
                 print('Entry "{}" title starts with j? but Java is not a code language.'.format(name))
 
         # search for duplicate keywords
@@ -257,11 +392,9 @@ class EntriesMaintainer:
 
         # get urls from rejected file
         text = utils.read_text(c.rejected_file)
-        regex = re.compile(r"\((http.*?)\)", re.MULTILINE)
-        matches = regex.findall(text)
         rejected_urls = []
-        for match in matches:
-            urls = match.split(',')
+        for match in regex_rejected_urls.finditer(text):
+            urls = match.group(1).split(',')
             urls = [x.strip() for x in urls]
             rejected_urls.extend(urls)
         included_urls.extend(rejected_urls)
@@ -287,7 +420,7 @@ class EntriesMaintainer:
         text = [x for x in text if utils.strip_url(x) not in stripped_urls]
 
         # remove duplicates and sort
-        text = sorted(list(set(text)), key=str.casefold)
+        text = sorted(set(text), key=str.casefold)
         print('backlog contains {} items'.format(len(text)))
 
         # join and save again
@@ -302,9 +435,6 @@ class EntriesMaintainer:
         from time to time.
         """
 
-        # regex for finding urls (can be in <> or in ]() or after a whitespace
-        regex = re.compile(r"[\s\n]<(http.+?)>|\]\((http.+?)\)|[\s\n](http[^\s\n,]+?)[\s\n\)]")
-
         # ignore the following patterns (they give false positives here)
         ignored_urls = (
         'https://git.tukaani.org/xz.git', 'https://git.code.sf.net/', 'http://hg.hedgewars.org/hedgewars/',
@@ -318,82 +448,37 @@ class EntriesMaintainer:
         import urllib3
         urllib3.disable_warnings()  # otherwise we cannot verify those with SSL errors without getting warnings
         urls = {}
-        for entry, _, content in osg.entry_iterator():
-            # apply regex
-            matches = regex.findall(content)
-            # for each match
-            for match in matches:
-                for url in match:
-                    if url and not any((url.startswith(x) for x in ignored_urls)):
-                        # ignore bzr.sourceforge, no web address found
-                        if 'bzr.sourceforge.net/bzrroot/' in url:
-                            continue
-
-                        # add "/" at the end
-                        if any((url.startswith(x) for x in (
-                        'https://anongit.freedesktop.org/git', 'https://git.savannah.gnu.org/git/',
-                        'https://git.savannah.nongnu.org/git/', 'https://git.artsoft.org/'))):
-                            url += '/'
-
-                        if url.startswith('https://bitbucket.org/') and url.endswith('.git'):
-                            url = url[:-4] + '/commits/'
-                        if url.startswith('https://svn.code.sf.net/p/'):
-                            url = 'http' + url[5:] + '/'
-                        if url.startswith('http://cvs.savannah.nongnu.org:/sources/'):
-                            url = 'http://cvs.savannah.nongnu.org/viewvc/' + url[40:] + '/'
-                        if url.startswith('http://cvs.savannah.gnu.org:/sources/'):
-                            url = 'http://cvs.savannah.gnu.org/viewvc/' + url[37:] + '/'
-
-                        # generally ".git" at the end is not working well, except sometimes
-                        if url.endswith('.git') and not any((url.startswith(x) for x in (
-                        'https://repo.or.cz', 'https://git.tuxfamily.org/fanwor/fanwor'))):
-                            url = url[:-4]
-
-                        if url in urls:
-                            urls[url].add(entry)
-                        else:
-                            urls[url] = {entry}
+        for entry, _, content in self.entry_contents():
+            # collect the links of each entry only once
+            for url in external_links(content, ignored_urls):
+                if url in urls:
+                    urls[url].add(entry)
+                else:
+                    urls[url] = {entry}
         print('found {} unique links'.format(len(urls)))
         print("start checking external links (can take a while)")
 
-        # now iterate over all urls
+        # split the links of each host into up to link_check_requests_per_host lists, the links of each list are
+        # checked one after the other, so that there are never more requests to the same host at the same time
+        links_by_host = {}
         for url, names in urls.items():
-            names = list(names)  # was a set
-            if len(names) == 1:
-                names = names[0]
-            try:
-                verify = True
-                # some have an expired certificate but otherwise still work
-                if any((url.startswith(x) for x in (
-                'https://perso.b2b2c.ca/~sarrazip/dev/', 'https://dreerally.com/', 'https://henlin.net/',
-                'https://www.megamek.org/', 'https://pixeldoctrine.com/', 'https://gitorious.org/',
-                'https://www.opmon-game.ga/'))):
-                    verify = False
-                r = requests.head(url, headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; WOW64)'}, timeout=20,
-                                  allow_redirects=True, verify=verify)
-                if r.status_code == 405:  # head method not supported, try get
-                    r = requests.get(url, headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; WOW64)'},
-                                     timeout=20, allow_redirects=True, verify=verify)
-                # check for bad status
-                if r.status_code != requests.codes.ok:
-                    print('{}: {} - {}'.format(names, url, r.status_code))
-                # check for redirect
-                if r.history and url not in redirect_okay:
-                    # only / added or http->https sometimes
-                    redirected_url = r.url
-                    if redirected_url == url + '/':
-                        output = '{}: {} -> {} - redirect "/" at end '
-                    elif redirected_url == 'https' + url[4:]:
-                        output = '{}: {} -> {} - redirect "https" at start'
-                    else:
-                        output = '{}: {} -> {} - redirect '
-                    print(output.format(names, url, redirected_url))
-            except Exception as e:
-                error_name = type(e).__name__
-                if error_name == 'SSLError' and any((url.startswith(x) for x in (
-                'https://gitorious.org/', 'https://www.freedroid.org/download/'))):
-                    continue  # even though verify is False, these errors still get through
-                print('{}: {} - exception {}'.format(names, url, error_name))
+            links_by_host.setdefault(urlsplit(url).netloc, []).append((url, names))
+        link_lists = [links[i::link_check_requests_per_host] for links in links_by_host.values()
+                      for i in range(min(link_check_requests_per_host, len(links)))]
+        link_lists.sort(key=len, reverse=True)  # start with the longest lists (github, sourceforge, ...)
+
+        # check all lists concurrently (mostly waiting for the servers), the session keeps the connections alive
+        # (a connection pool for every host)
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=len(links_by_host),
+                                                pool_maxsize=link_check_requests_per_host)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        with ThreadPoolExecutor(max_workers=link_check_workers) as executor:
+            futures = [executor.submit(check_external_links_in_turn, session, links, redirect_okay) for links in link_lists]
+            for future in as_completed(futures):
+                for message in future.result():
+                    print(message)
 
         print('external links checked')
 
@@ -407,54 +492,66 @@ class EntriesMaintainer:
 
         Needs to be performed regularly.
         """
+        if not self.entries:
+            print('entries not yet loaded')
+            return
 
         # completely delete content of toc path
-        for file in os.listdir(c.tocs_path):
-            os.remove(os.path.join(c.tocs_path, file))
+        with os.scandir(c.tocs_path) as it:
+            for file in it:
+                os.remove(file.path)
 
         # read readme
         readme_file = os.path.join(c.root_path, 'README.md')
         readme_text = utils.read_text(readme_file)
 
-        # compile regex for identifying the building blocks in the readme
-        regex = re.compile(r"(.*?)(\[comment\]: # \(start.*?end of autogenerated content\))(.*)", re.DOTALL)
-
-        # apply regex
-        matches = regex.findall(readme_text)
-        if len(matches) != 1:
+        # identify the building blocks (before and after the autogenerated block)
+        start_index = readme_text.find(readme_start_marker)
+        end_index = readme_text.find(readme_end_marker, start_index)
+        if start_index < 0 or end_index < 0:
             raise RuntimeError('readme file has invalid structure')
-        matches = matches[0]
-        start = matches[0]
-        end = matches[2]
+        start = readme_text[:start_index]
+        end = readme_text[end_index + len(readme_end_marker):]
 
         tocs_text = ''
 
+        # the row of an entry is the same in all TOCs it appears in, create it only once
+        toc_rows = {entry['File']: toc_row(entry) for entry in self.entries}
+
         # split into games, tools, frameworks, libraries
-        games = [x for x in self.entries if not any([y in x['Keyword'] for y in ('tool', 'framework', 'library')])]
-        tools = [x for x in self.entries if 'tool' in x['Keyword']]
-        frameworks = [x for x in self.entries if 'framework' in x['Keyword']]
-        libraries = [x for x in self.entries if 'library' in x['Keyword']]
-        
+        games, tools, frameworks, libraries = [], [], [], []
+        for entry in self.entries:
+            keywords = toc_category_keywords.intersection(entry['Keyword'])
+            if not keywords:
+                games.append(entry)
+                continue
+            if 'tool' in keywords:
+                tools.append(entry)
+            if 'framework' in keywords:
+                frameworks.append(entry)
+            if 'library' in keywords:
+                libraries.append(entry)
+
         # create games, tools, frameworks, libraries tocs
         title = 'Games'
         file = '_games.md'
         tocs_text += '**[{}](entries/tocs/{}#{})** ({}) - '.format(title, file, title, len(games))
-        create_toc(title, file, games)
+        create_toc(title, file, [toc_rows[x['File']] for x in games])
 
         title = 'Tools'
         file = '_tools.md'
         tocs_text += '**[{}](entries/tocs/{}#{})** ({}) - '.format(title, file, title, len(tools))
-        create_toc(title, file, tools)
+        create_toc(title, file, [toc_rows[x['File']] for x in tools])
 
         title = 'Frameworks'
         file = '_frameworks.md'
         tocs_text += '**[{}](entries/tocs/{}#{})** ({}) - '.format(title, file, title, len(frameworks))
-        create_toc(title, file, frameworks)
+        create_toc(title, file, [toc_rows[x['File']] for x in frameworks])
 
         title = 'Libraries'
         file = '_libraries.md'
         tocs_text += '**[{}](entries/tocs/{}#{})** ({})\n'.format(title, file, title, len(libraries))
-        create_toc(title, file, libraries)
+        create_toc(title, file, [toc_rows[x['File']] for x in libraries])
 
         # create by category
         categories_text = []
@@ -464,7 +561,7 @@ class EntriesMaintainer:
             name = keyword.replace(' ', '-')
             file = '_{}.md'.format(name)
             categories_text.append('**[{}](entries/tocs/{}#{})** ({})'.format(title, file, name, len(filtered)))
-            create_toc(title, file, filtered)
+            create_toc(title, file, [toc_rows[x['File']] for x in filtered])
         categories_text.sort()
         tocs_text += '\nBy category: {}\n'.format(', '.join(categories_text))
 
@@ -476,7 +573,7 @@ class EntriesMaintainer:
             name = platform.lower()
             file = '_{}.md'.format(name)
             platforms_text.append('**[{}](entries/tocs/{}#{})** ({})'.format(title, file, name, len(filtered)))
-            create_toc(title, file, filtered)
+            create_toc(title, file, [toc_rows[x['File']] for x in filtered])
         tocs_text += '\nBy platform: {}\n'.format(', '.join(platforms_text))
 
         # insert new text in the middle (the \n before the second comment is necessary, otherwise Markdown displays it as part of the bullet list)
@@ -498,221 +595,210 @@ class EntriesMaintainer:
             return
 
         # start the page
-        statistics = '[comment]: # (autogenerated content, do not edit)\n# Statistics\n\n'
+        statistics = ['[comment]: # (autogenerated content, do not edit)\n# Statistics\n\n']
 
         # total number
         number_entries = len(self.entries)
         rel = lambda x: x / number_entries * 100  # conversion to percent
 
-        statistics += 'analyzed {} entries on {}\n\n'.format(number_entries,
-                                                             datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+        statistics.append('analyzed {} entries on {}\n\n'.format(number_entries,
+                                                                 datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')))
+
+        # gather all needed information in a single pass over the entries
+        number_state_beta = 0
+        number_state_mature = 0
+        entries_inactive = []
+        languages = []
+        licenses = []
+        keywords = []
+        entries_without_download_or_play = []
+        entries_without_popular_repository = []
+        code_dependencies = []
+        entries_with_code_dependency = 0
+        build_systems = []
+        c_cpp_project_without_build_system = []
+        c_cpp_project_not_cmake = []
+        platforms = []
+        for entry in self.entries:
+            title = entry['Title']
+
+            # state
+            state = entry['State']
+            if 'beta' in state:
+                number_state_beta += 1
+            if 'mature' in state:
+                number_state_mature += 1
+            inactive_year = osg.extract_inactive_year(entry)
+            if inactive_year is not None:
+                entries_inactive.append((title, inactive_year))
+
+            # languages, licenses, keywords (reduce those starting with "multiplayer")
+            languages.extend(entry['Code language'])
+            licenses.extend(entry['Code license'])
+            keywords.extend(x if not x.startswith('multiplayer') else 'multiplayer' for x in entry['Keyword'])
+
+            # no download or play field
+            if 'Download' not in entry and 'Play' not in entry:
+                entries_without_download_or_play.append(title)
+
+            # code hosted not on a popular site (or no code repository at all)
+            if not any(regex_popular_code_repositories.search(repo) for repo in entry.get('Code repository', [])):
+                entries_without_popular_repository.append(title)
+
+            # code dependencies
+            if 'Code dependency' in entry:
+                code_dependencies.extend(entry['Code dependency'])
+                entries_with_code_dependency += 1
+
+            # build systems (and C, C++ projects without build system information or without CMake)
+            c_cpp_project = 'C' in entry['Code language'] or 'C++' in entry['Code language']
+            if 'Build system' in entry['Building']:
+                build_system = entry['Building']['Build system']
+                build_systems.extend(build_system)
+                if c_cpp_project and 'CMake' not in build_system:
+                    c_cpp_project_not_cmake.append(title)
+            elif c_cpp_project:
+                c_cpp_project_without_build_system.append(title)
+
+            # platforms
+            if 'Platform' in entry:
+                platforms.extend(entry['Platform'])
 
         # State (beta, mature, inactive)
-        statistics += '## State\n\n'
+        statistics.append('## State\n\n')
 
-        number_state_beta = sum(1 for x in self.entries if 'beta' in x['State'])
-        number_state_mature = sum(1 for x in self.entries if 'mature' in x['State'])
-        number_inactive = sum(1 for x in self.entries if osg.is_inactive(x))
-        statistics += '- mature: {} ({:.1f}%)\n- beta: {} ({:.1f}%)\n- inactive: {} ({:.1f}%)\n\n'.format(
+        number_inactive = len(entries_inactive)
+        statistics.append('- mature: {} ({:.1f}%)\n- beta: {} ({:.1f}%)\n- inactive: {} ({:.1f}%)\n\n'.format(
             number_state_mature, rel(number_state_mature), number_state_beta, rel(number_state_beta), number_inactive,
-            rel(number_inactive))
+            rel(number_inactive)))
 
         if number_inactive > 0:
-            entries_inactive = [(x['Title'], osg.extract_inactive_year(x)) for x in self.entries if osg.is_inactive(x)]
-            entries_inactive.sort(key=lambda x: str.casefold(x[0]))  # first sort by name
-            entries_inactive.sort(key=lambda x: x[1], reverse=True)  # then sort by inactive year (more recently first)
+            # sort by inactive year (more recently first), then by name
+            entries_inactive.sort(key=lambda x: (-x[1], str.casefold(x[0])))
             entries_inactive = ['{} ({})'.format(*x) for x in entries_inactive]
-            statistics += '##### Inactive State\n\n' + ', '.join(entries_inactive) + '\n\n'
+            statistics.append('##### Inactive State\n\n' + ', '.join(entries_inactive) + '\n\n')
 
         # Language
-        statistics += '## Code Languages\n\n'
-        field = 'Code language'
-
-        # get all languages together
-        languages = []
-        for entry in self.entries:
-            languages.extend(entry[field])
+        statistics.append('## Code Languages\n\n')
 
-        unique_languages = set(languages)
-        unique_languages = [(l, languages.count(l) / len(languages)) for l in unique_languages]
+        unique_languages = Counter(languages)
+        unique_languages = [(l, n / len(languages)) for l, n in unique_languages.items()]
         unique_languages.sort(key=lambda x: str.casefold(x[0]))  # first sort by name
 
         # print languages to console
         print('\nLanguages\n')
         print('\n'.join('{} ({:.1f}%)'.format(x[0], x[1] * 100) for x in unique_languages))
 
-        unique_languages.sort(key=lambda x: x[1], reverse=True)  # then sort by occurrence (highest occurrence first)
+        unique_languages.sort(key=itemgetter(1), reverse=True)  # then sort by occurrence (highest occurrence first)
         unique_languages = ['- {} ({:.1f}%)\n'.format(x[0], x[1] * 100) for x in unique_languages]
-        statistics += '##### Language frequency\n\n' + ''.join(unique_languages) + '\n'
+        statistics.append('##### Language frequency\n\n' + ''.join(unique_languages) + '\n')
 
         # Licenses
-        statistics += '## Code licenses\n\n'
-        field = 'Code license'
+        statistics.append('## Code licenses\n\n')
 
-        # get all licenses together
-        licenses = []
-        for entry in self.entries:
-            licenses.extend(entry[field])
-
-        unique_licenses = set(licenses)
-        unique_licenses = [(l, licenses.count(l) / len(licenses)) for l in unique_licenses]
+        unique_licenses = Counter(licenses)
+        unique_licenses = [(l, n / len(licenses)) for l, n in unique_licenses.items()]
         unique_licenses.sort(key=lambda x: str.casefold(x[0]))  # first sort by name
 
         # print licenses to console
         print('\nLicenses\n')
         print('\n'.join('{} ({:.1f}%)'.format(x[0], x[1] * 100) for x in unique_licenses))
 
-        unique_licenses.sort(key=lambda x: -x[1])  # then sort by occurrence (highest occurrence first)
+        unique_licenses.sort(key=itemgetter(1), reverse=True)  # then sort by occurrence (highest occurrence first)
         unique_licenses = ['- {} ({:.1f}%)\n'.format(x[0], x[1] * 100) for x in unique_licenses]
-        statistics += '##### Licenses frequency\n\n' + ''.join(unique_licenses) + '\n'
+        statistics.append('##### Licenses frequency\n\n' + ''.join(unique_licenses) + '\n')
 
         # Keywords
-        statistics += '## Keywords\n\n'
-        field = 'Keyword'
-
-        # get all keywords together
-        keywords = []
-        for entry in self.entries:
-            keywords.extend(entry[field])
+        statistics.append('## Keywords\n\n')
 
-        # reduce those starting with "multiplayer"
-        keywords = [x if not x.startswith('multiplayer') else 'multiplayer' for x in keywords]
-
-        unique_keywords = set(keywords)
-        unique_keywords = [(l, keywords.count(l) / len(keywords)) for l in unique_keywords]
+        unique_keywords = Counter(keywords)
+        unique_keywords = [(l, n / len(keywords)) for l, n in unique_keywords.items()]
         unique_keywords.sort(key=lambda x: str.casefold(x[0]))  # first sort by name
 
         # print keywords to console
         print('\nKeywords\n')
         print('\n'.join('{} ({:.1f}%)'.format(x[0], x[1] * 100) for x in unique_keywords))
 
-        unique_keywords.sort(key=lambda x: -x[1])  # then sort by occurrence (highest occurrence first)
+        unique_keywords.sort(key=itemgetter(1), reverse=True)  # then sort by occurrence (highest occurrence first)
         unique_keywords = ['- {} ({:.1f}%)'.format(x[0], x[1] * 100) for x in unique_keywords]
-        statistics += '##### Keywords frequency\n\n' + '\n'.join(unique_keywords) + '\n\n'
+        statistics.append('##### Keywords frequency\n\n' + '\n'.join(unique_keywords) + '\n\n')
 
         # no download or play field
-        statistics += '## Entries without download or play fields\n\n'
+        statistics.append('## Entries without download or play fields\n\n')
 
-        entries = []
-        for entry in self.entries:
-            if 'Download' not in entry and 'Play' not in entry:
-                entries.append(entry['Title'])
-        entries.sort(key=str.casefold)
-        statistics += '{}: '.format(len(entries)) + ', '.join(entries) + '\n\n'
+        entries_without_download_or_play.sort(key=str.casefold)
+        statistics.append('{}: '.format(len(entries_without_download_or_play)) + ', '.join(
+            entries_without_download_or_play) + '\n\n')
 
         # code hosted not on github, gitlab, bitbucket, launchpad, sourceforge
-        popular_code_repositories = ('github.com', 'gitlab.com', 'bitbucket.org', 'code.sf.net', 'code.launchpad.net')
-        statistics += '## Entries with a code repository not on a popular site\n\n'
+        statistics.append('## Entries with a code repository not on a popular site\n\n')
 
-        entries = []
-        field = 'Code repository'
-        for entry in self.entries:
-            popular = False
-            for repo in entry.get(field, []):
-                for popular_repo in popular_code_repositories:
-                    if popular_repo in repo:
-                        popular = True
-                        break
-            # if there were repositories, but none popular, add them to the list
-            if not popular:
-                entries.append(entry['Title'])
-                # print(info[field])
-        entries.sort(key=str.casefold)
-        statistics += '{}: '.format(len(entries)) + ', '.join(entries) + '\n\n'
+        entries_without_popular_repository.sort(key=str.casefold)
+        statistics.append('{}: '.format(len(entries_without_popular_repository)) + ', '.join(
+            entries_without_popular_repository) + '\n\n')
 
         # Code dependencies
-        statistics += '## Code dependencies\n\n'
-        field = 'Code dependency'
+        statistics.append('## Code dependencies\n\n')
 
-        # get all code dependencies together
-        code_dependencies = []
-        entries_with_code_dependency = 0
-        for entry in self.entries:
-            if field in entry:
-                code_dependencies.extend(entry[field])
-                entries_with_code_dependency += 1
-        statistics += 'With code dependency field {} ({:.1f}%)\n\n'.format(entries_with_code_dependency,
-                                                                           rel(entries_with_code_dependency))
+        statistics.append('With code dependency field {} ({:.1f}%)\n\n'.format(entries_with_code_dependency,
+                                                                               rel(entries_with_code_dependency)))
 
-        unique_code_dependencies = set(code_dependencies)
-        unique_code_dependencies = [(l, code_dependencies.count(l) / len(code_dependencies)) for l in
-                                    unique_code_dependencies]
+        unique_code_dependencies = Counter(code_dependencies)
+        unique_code_dependencies = [(l, n / len(code_dependencies)) for l, n in unique_code_dependencies.items()]
         unique_code_dependencies.sort(key=lambda x: str.casefold(x[0]))  # first sort by name
 
         # print code dependencies to console
         print('\nCode dependencies\n')
         print('\n'.join('{} ({:.1f}%)'.format(x[0], x[1] * 100) for x in unique_code_dependencies))
 
-        unique_code_dependencies.sort(key=lambda x: -x[1])  # then sort by occurrence (highest occurrence first)
+        unique_code_dependencies.sort(key=itemgetter(1), reverse=True)  # then sort by occurrence (highest occurrence first)
         unique_code_dependencies = ['- {} ({:.1f}%)'.format(x[0], x[1] * 100) for x in unique_code_dependencies]
-        statistics += '##### Code dependencies frequency\n\n' + '\n'.join(unique_code_dependencies) + '\n\n'
+        statistics.append('##### Code dependencies frequency\n\n' + '\n'.join(unique_code_dependencies) + '\n\n')
 
         # Build systems:
-        statistics += '## Build systems\n\n'
-        field = 'Build system'
+        statistics.append('## Build systems\n\n')
 
-        # get all build systems together
-        build_systems = []
-        for entry in self.entries:
-            if field in entry['Building']:
-                build_systems.extend(entry['Building'][field])
+        statistics.append('Build systems information available for {:.1f}% of all projects.\n\n'.format(
+            rel(len(build_systems))))
 
-        statistics += 'Build systems information available for {:.1f}% of all projects.\n\n'.format(
-            rel(len(build_systems)))
-
-        unique_build_systems = set(build_systems)
-        unique_build_systems = [(l, build_systems.count(l) / len(build_systems)) for l in unique_build_systems]
+        unique_build_systems = Counter(build_systems)
+        unique_build_systems = [(l, n / len(build_systems)) for l, n in unique_build_systems.items()]
         unique_build_systems.sort(key=lambda x: str.casefold(x[0]))  # first sort by name
 
         # print build systems to console
         print('\nBuild systems\n')
         print('\n'.join('{} ({:.1f}%)'.format(x[0], x[1] * 100) for x in unique_build_systems))
 
-        unique_build_systems.sort(key=lambda x: -x[1])  # then sort by occurrence (highest occurrence first)
+        unique_build_systems.sort(key=itemgetter(1), reverse=True)  # then sort by occurrence (highest occurrence first)
         unique_build_systems = ['- {} ({:.1f}%)'.format(x[0], x[1] * 100) for x in unique_build_systems]
-        statistics += '##### Build systems frequency ({})\n\n'.format(len(build_systems)) + '\n'.join(
-            unique_build_systems) + '\n\n'
+        statistics.append('##### Build systems frequency ({})\n\n'.format(len(build_systems)) + '\n'.join(
+            unique_build_systems) + '\n\n')
 
         # C, C++ projects without build system information
-        c_cpp_project_without_build_system = []
-        for entry in self.entries:
-            if field not in entry and ('C' in entry['Code language'] or 'C++' in entry['Code language']):
-                c_cpp_project_without_build_system.append(entry['Title'])
         c_cpp_project_without_build_system.sort(key=str.casefold)
-        statistics += '##### C and C++ projects without build system information ({})\n\n'.format(
-            len(c_cpp_project_without_build_system)) + ', '.join(c_cpp_project_without_build_system) + '\n\n'
+        statistics.append('##### C and C++ projects without build system information ({})\n\n'.format(
+            len(c_cpp_project_without_build_system)) + ', '.join(c_cpp_project_without_build_system) + '\n\n')
 
         # C, C++ projects with build system information but without CMake as build system
-        c_cpp_project_not_cmake = []
-        for entry in entries:
-            if field in entry and 'CMake' in entry[field] and (
-                    'C' in entry['Code language'] or 'C++' in entry['Code language']):
-                c_cpp_project_not_cmake.append(entry['Title'])
         c_cpp_project_not_cmake.sort(key=str.casefold)
-        statistics += '##### C and C++ projects with a build system different from CMake ({})\n\n'.format(
-            len(c_cpp_project_not_cmake)) + ', '.join(c_cpp_project_not_cmake) + '\n\n'
+        statistics.append('##### C and C++ projects with a build system different from CMake ({})\n\n'.format(
+            len(c_cpp_project_not_cmake)) + ', '.join(c_cpp_project_not_cmake) + '\n\n')
 
         # Platform
-        statistics += '## Platform\n\n'
-        field = 'Platform'
-
-        # get all platforms together
-        platforms = []
-        for entry in self.entries:
-            if field in entry:
-                platforms.extend(entry[field])
+        statistics.append('## Platform\n\n')
 
-        statistics += 'Platform information available for {:.1f}% of all projects.\n\n'.format(rel(len(platforms)))
+        statistics.append('Platform information available for {:.1f}% of all projects.\n\n'.format(
+            rel(len(platforms))))
 
-        unique_platforms = set(platforms)
-        unique_platforms = [(l, platforms.count(l) / len(platforms)) for l in unique_platforms]
-        unique_platforms.sort(key=lambda x: str.casefold(x[0]))  # first sort by name
-        unique_platforms.sort(key=lambda x: -x[1])  # then sort by occurrence (highest occurrence first)
+        unique_platforms = Counter(platforms)
+        unique_platforms = [(l, n / len(platforms)) for l, n in unique_platforms.items()]
+        # sort by occurrence (highest occurrence first), then by name
+        unique_platforms.sort(key=lambda x: (-x[1], str.casefold(x[0])))
         unique_platforms = ['- {} ({:.1f}%)'.format(x[0], x[1] * 100) for x in unique_platforms]
-        statistics += '##### Platforms frequency\n\n' + '\n'.join(unique_platforms) + '\n\n'
+        statistics.append('##### Platforms frequency\n\n' + '\n'.join(unique_platforms) + '\n\n')
 
         # write to statistics file
-        utils.write_text(c.statistics_file, statistics)
+        utils.write_text(c.statistics_file, ''.join(statistics))
 
         print('statistics updated')
 
@@ -725,6 +811,7 @@ class EntriesMaintainer:
             return
 
         primary_repos = {'git': [], 'svn': [], 'hg': []}
+        repo_types = (('git', osg.git_repo), ('svn', osg.svn_repo), ('hg', osg.hg_repo))  # tested in this order
         unconsumed_entries = []
 
         # for every entry filter those that are known git repositories (add additional repositories)
@@ -735,25 +822,14 @@ class EntriesMaintainer:
                 continue
             repos = [repos[0]] + [x for x in repos[1:] if "@add" in x]
             for repo in repos:
-                consumed = False
                 repo = repo.split(' ')[0].strip()
-                url = osg.git_repo(repo)
-                if url:
-                    primary_repos['git'].append(url)
-                    consumed = True
-                    continue
-                url = osg.svn_repo(repo)
-                if url:
-                    primary_repos['svn'].append(url)
-                    consumed = True
-                    continue
-                url = osg.hg_repo(repo)
-                if url:
-                    primary_repos['hg'].append(url)
-                    consumed = True
-                    continue
-
-                if not consumed:
+                # the first recognizing repository type consumes the repo
+                for repo_type, recognize in repo_types:
+                    url = recognize(repo)
+                    if url:
+                        primary_repos[repo_type].append(url)
+                        break
+                else:
                     unconsumed_entries.append([entry['Title'], repo])
                     print('Entry "{}" unconsumed repo: {}'.format(entry['File'], repo))
 
@@ -772,8 +848,7 @@ class EntriesMaintainer:
 
         # write them to code/git
         json_path = os.path.join(c.root_path, 'code', 'archives.json')
-        text = json.dumps(primary_repos, indent=1)
-        utils.write_text(json_path, text)
+        utils.write_json(json_path, primary_repos)
 
         print('Repositories updated')
 
@@ -793,12 +868,11 @@ class EntriesMaintainer:
                     git_repos.append(repo)
 
         # sort them alphabetically (and remove duplicates)
-        git_repos = sorted(list(set(git_repos)), key=str.casefold)
+        git_repos = sorted(set(git_repos), key=str.casefold)
 
         # write them to code/git
         json_path = os.path.join(c.root_path, 'code', 'git_repositories.json')
-        text = json.dumps(git_repos, indent=1)
-        utils.write_text(json_path, text)
+        utils.write_json(json_path, git_repos)
 
     def special_ops(self):
         """
@@ -898,7 +972,18 @@ class EntriesMaintainer:
         print('special ops finished')
 
     def complete_run(self):
-        pass
+        """
+        Reads the entries once and then runs all regularly needed operations on them. Operations that should only be
+        run occasionally (template leftovers, external links) are not included.
+        """
+        self.read_entries()
+        self.write_entries()
+        self.clean_rejected()
+        self.clean_backlog()
+        self.update_readme_tocs()
+        self.update_statistics()
+        self.update_repos()
+        print('complete run finished')
 
 
 if __name__ == "__main__":
@@ -53,7 +53,7 @@ class InspirationMaintainer:
             for other_name in inspiration_names[index + 1:]:
                 if any((name.startswith(x) and other_name.startswith(x) for x in valid_duplicates)):
                     continue
-                if osg.name_similarity(str.casefold(name), str.casefold(other_name)) > 0.9:
+                if osg.names_are_similar(name, other_name, 0.9):
                     print(' {} - {} is similar'.format(name, other_name))
         print('duplicates checked took {:.1f}s'.format(time.process_time()-start_time))
 
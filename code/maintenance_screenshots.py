@@ -11,10 +11,9 @@ if __name__ == "__main__":
 
     # read available screenshots (and get widths and heights)
     files = {}
-    for file in os.listdir(c.screenshots_path):
-        path = os.path.join(c.screenshots_path, file)
-        if os.path.isdir(path) or path == c.screenshots_file:
-            continue
+    with os.scandir(c.screenshots_path) as it:
+        screenshots = [(x.name, x.path) for x in it if not x.is_dir() and x.path != c.screenshots_file]
+    for file, path in screenshots:
         if not file.endswith('.jpg'):
             print('Screenshot with unexpected extension: {}'.format(file))
             continue
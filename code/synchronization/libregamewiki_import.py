@@ -16,6 +16,8 @@ import re
 from bs4 import BeautifulSoup
 from utils import constants, utils, osg
 
+regex_parenthesized = re.compile(r'\([^)]*\)')
+
 
 def download_lgw_content():
     """
@@ -48,7 +50,7 @@ def download_lgw_content():
         url = base_url + next_page['href']
 
     # remove all those that start with user
-    games = [game for game in games if not any(game[1].startswith(x) for x in ('User:', 'Template:', 'Bullet'))]
+    games = [game for game in games if not game[1].startswith(('User:', 'Template:', 'Bullet'))]
 
     print('current number of games in LGW {}'.format(len(games)))
 
@@ -224,7 +226,7 @@ def remove_parenthized_content(entries, fields):
                 content = entry[field]
                 if not isinstance(content, list):
                     content = [content]
-                content = [re.sub(r'\([^)]*\)', '', c) for c in content]  # remove parentheses content
+                content = [regex_parenthesized.sub('', c) if '(' in c else c for c in content]  # remove parentheses content
                 content = [x.strip() for x in content]
                 content = list(set(content))
                 entry[field] = content
@@ -284,20 +286,20 @@ def clean_lgw_content():
     unique_fields = set()
     for entry in entries:
         unique_fields.update(entry.keys())
-    print('unique lgw fields: {}'.format(sorted(list(unique_fields))))
+    print('unique lgw fields: {}'.format(sorted(unique_fields)))
 
     # which fields are mandatory
     mandatory_fields = unique_fields.copy()
     for entry in entries:
         remove_fields = [field for field in mandatory_fields if field not in entry]
         mandatory_fields -= set(remove_fields)
-    print('mandatory lgw fields: {}'.format(sorted(list(mandatory_fields))))
+    print('mandatory lgw fields: {}'.format(sorted(mandatory_fields)))
 
     # statistics before
     print('field contents before')
-    fields = sorted(list(unique_fields - {'description', 'external links', 'dev home', 'forum', 'home',
-                                          'linux-packages', 'developer', 'chat', 'tracker', 'Latest release', 'name',
-                                          'repo', 'Release date', 'categories'}))
+    fields = sorted(unique_fields - {'description', 'external links', 'dev home', 'forum', 'home',
+                                     'linux-packages', 'developer', 'chat', 'tracker', 'Latest release', 'name',
+                                     'repo', 'Release date', 'categories'})
     for field in fields:
         content = [entry[field] for entry in entries if field in entry]
         # flatten
@@ -349,9 +351,9 @@ def clean_lgw_content():
 
     # list for every unique field
     print('\nfield contents after')
-    fields = sorted(list(unique_fields - {'description', 'external links', 'dev home', 'forum', 'home',
-                                          'linux-packages', 'developer', 'chat', 'tracker', 'Latest release', 'name',
-                                          'repo', 'Release date', 'categories'}))
+    fields = sorted(unique_fields - {'description', 'external links', 'dev home', 'forum', 'home',
+                                     'linux-packages', 'developer', 'chat', 'tracker', 'Latest release', 'name',
+                                     'repo', 'Release date', 'categories'})
     for field in fields:
         content = [entry[field] for entry in entries if field in entry]
         # flatten
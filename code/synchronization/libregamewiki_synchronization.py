@@ -72,10 +72,10 @@ def compare_sets(a, b, name, limit=None):
         a = set(a)
     if not isinstance(b, set):
         b = set(b)
-    d = sorted(list(a - b))
+    d = sorted(a - b)
     if d and limit != 'notus':
         p += ' {} : us :  {}\n'.format(name, ', '.join(d))
-    d = sorted(list(b - a))
+    d = sorted(b - a)
     if d and limit != 'notthem':
         p += ' {} : them : {}\n'.format(name, ', '.join(d))
     return p
@@ -132,14 +132,14 @@ if __name__ == "__main__":
     unique_fields = set()
     for lgw_entry in lgw_entries:
         unique_fields.update(lgw_entry.keys())
-    print('unique lgw fields: {}'.format(sorted(list(unique_fields))))
+    print('unique lgw fields: {}'.format(sorted(unique_fields)))
 
     # which fields are mandatory
     mandatory_fields = unique_fields.copy()
     for lgw_entry in lgw_entries:
         remove_fields = [field for field in mandatory_fields if field not in lgw_entry]
         mandatory_fields -= set(remove_fields)
-    print('mandatory lgw fields: {}'.format(sorted(list(mandatory_fields))))
+    print('mandatory lgw fields: {}'.format(sorted(mandatory_fields)))
 
     # read our database
     our_entries = osg.read_entries()
@@ -157,7 +157,7 @@ if __name__ == "__main__":
     print('similar names (them - us')
     for lgw_name in lgw_names:
         for our_name in our_names:
-            if osg.name_similarity(lgw_name, our_name) > similarity_threshold:
+            if osg.names_are_similar(lgw_name, our_name, similarity_threshold):
                 print('"{}" - "{}"'.format(lgw_name, our_name))
 
     newly_created_entries = 0
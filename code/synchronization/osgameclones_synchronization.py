@@ -88,7 +88,7 @@ def unique_field_contents(entries, field):
                 unique_content.update(field_content)
             else:
                 unique_content.add(field_content)
-    unique_content = sorted(list(unique_content), key=str.casefold)
+    unique_content = sorted(unique_content, key=str.casefold)
     return unique_content
 
 
@@ -106,10 +106,10 @@ def compare_sets(a, b, name, limit=None):
         a = set(a)
     if not isinstance(b, set):
         b = set(b)
-    d = sorted(list(a - b))
+    d = sorted(a - b)
     if d and limit != 'notus':
         p += ' {} : us :  {}\n'.format(name, ', '.join(d))
-    d = sorted(list(b - a))
+    d = sorted(b - a)
     if d and limit != 'notthem':
         p += ' {} : them : {}\n'.format(name, ', '.join(d))
     return p
@@ -185,7 +185,7 @@ if __name__ == "__main__":
             if isinstance(osgc_repos, str):
                 osgc_repos = [osgc_repos]
             for repo in osgc_repos:
-                if 'github' in repo and any((repo.endswith(x) for x in ('/', '.git'))):
+                if 'github' in repo and repo.endswith(('/', '.git')):
                     untypical_structure += ' {} : {}\n'.format(osgc_entry['name'], repo)
     if untypical_structure:
         print('Git repos in osgc with untypical URL\n{}'.format(untypical_structure))
@@ -194,7 +194,7 @@ if __name__ == "__main__":
     osgc_fields = set()
     for osgc_entry in osgc_entries:
         osgc_fields.update(osgc_entry.keys())
-    osgc_fields = sorted(list(osgc_fields))
+    osgc_fields = sorted(osgc_fields)
     print('Unique osgc-fields\n {}'.format(', '.join(osgc_fields)))
 
     for field in osgc_fields:
@@ -275,7 +275,7 @@ if __name__ == "__main__":
         print('look for similar names (theirs - ours)')
         for osgc_name in osgc_names:
            for our_name in our_names:
-               if osg.name_similarity(osgc_name, our_name) > similarity_threshold:
+               if osg.names_are_similar(osgc_name, our_name, similarity_threshold):
                    print(' {} - {}'.format(osgc_name, our_name))
 
     newly_created_entries = 0
@@ -323,7 +323,7 @@ if __name__ == "__main__":
                             target_width = int(width / height * target_height)
                             im_resized = im.resize((target_width, target_height), resample=Image.LANCZOS)
                             idx = len(our_screenshots) + 1
-                            if any([image_url.startswith(x) for x in ('https://camo.githubusercontent', 'https://web.archive.org', ' https://user-content.gitlab', 'https://user-images.githubusercontent')]) or width <= 320:
+                            if image_url.startswith(('https://camo.githubusercontent', 'https://web.archive.org', ' https://user-content.gitlab', 'https://user-images.githubusercontent')) or width <= 320:
                                 image_url = '!' + image_url
                             our_screenshots[idx] = [target_width, target_height, image_url]
                             outfile = os.path.join(c.screenshots_path, '{}_{:02d}.jpg'.format(our_file, idx));
@@ -58,7 +58,7 @@ if __name__ == "__main__":
                 target_width = int(width / height * target_height)
                 im_resized = im.resize((target_width, target_height), resample=Image.LANCZOS)
                 idx = len(our_screenshots) + 1
-                if any([url.startswith(x) for x in ('https://camo.githubusercontent', 'https://web.archive.org', ' https://user-content.gitlab', 'https://user-images.githubusercontent')]) or width <= 320:
+                if url.startswith(('https://camo.githubusercontent', 'https://web.archive.org', ' https://user-content.gitlab', 'https://user-images.githubusercontent')) or width <= 320:
                     url = '!' + url
                 our_screenshots[idx] = [target_width, target_height, url]
                 # store
@@ -34,11 +34,11 @@ if __name__ == "__main__":
     for items in text:
         items = items.split('\n')
         category = items[0].strip()
-        items = [item for item in items[1:] if item.startswith('- ') or item.startswith('* ')]
+        items = [item for item in items[1:] if item.startswith(('- ', '* '))]
         for item in items:
             # print(item)
             # print(matcher.findall(item))
-            matches = matcher.findall(item)[0]  # we know it will be exactly one
+            matches = matcher.search(item).groups()  # we know every item matches (title, url, description)
             title = matches[0]
             url = matches[1]
             description = matches[2]
@@ -141,7 +141,7 @@ language_urls = {
     'ZenScript': 'https://github.com/CraftTweaker/ZenScript'
 }
 
-known_languages = tuple(sorted(list(language_urls.keys()), key=str.casefold)) + ('None', '?')
+known_languages = tuple(sorted(language_urls.keys(), key=str.casefold)) + ('None', '?')
 
 # known licenses, anything outside of this will result in a warning during a maintenance operation
 # only these will be used when gathering statistics
@@ -4,46 +4,78 @@ Specific functions working on the games.
 
 import re
 import os
+from concurrent.futures import ThreadPoolExecutor
 from difflib import SequenceMatcher
+from functools import lru_cache
+from rapidfuzz import fuzz
 from utils import utils, osg_parse, constants as c
 
 regex_sanitize_name = re.compile(r"[^A-Za-z 0-9-+]+")
 regex_sanitize_name_space_eater = re.compile(r" +")
 
+# umlauts are replaced by their base letter (after casefolding) in canonical names
+canonical_name_umlauts = str.maketrans('öäü', 'oau')
+
+# positions of the valid fields and platforms (they must appear in this order)
+valid_field_ranks = {field: index for index, field in enumerate(c.valid_fields)}
+valid_platform_ranks = {platform: index for index, platform in enumerate(c.valid_platforms)}
+
+# for fast membership tests (the tuples in constants define the order)
+recommended_keywords = frozenset(c.recommended_keywords)
+known_languages = frozenset(c.known_languages)
+known_licenses = frozenset(c.known_licenses)
+
 
 def name_similarity(a, b):
     return SequenceMatcher(None, str.casefold(a), str.casefold(b)).ratio()
 
 
-def entry_iterator():
+def names_are_similar(a, b, threshold):
+    """
+    Same as name_similarity(a, b) > threshold, but faster when comparing many names. The indel ratio of rapidfuzz
+    (based on the longest common subsequence) is never smaller than the ratio of SequenceMatcher, so it is computed
+    first and the slow SequenceMatcher is only run for the few pairs above the threshold (a small tolerance accounts
+    for rounding).
     """
+    a, b = str.casefold(a), str.casefold(b)
+    return fuzz.ratio(a, b) > threshold * 100 - 1e-6 and SequenceMatcher(None, a, b).ratio() > threshold
+
 
+def entry_files():
+    """
+    Lists all entry files (once, as a list), returning tuples of the file name and the file path of each entry.
     """
 
-    # get all entries (ignore everything starting with underscore)
-    entries = os.listdir(c.entries_path)
+    # ignore directories ("tocs" for example), scandir already knows the file type without extra stats
+    with os.scandir(c.entries_path) as it:
+        return [(x.name, x.path) for x in it if not x.is_dir()]
 
-    # iterate over all entries
-    for entry in entries:
-        entry_path = os.path.join(c.entries_path, entry)
 
-        # ignore directories ("tocs" for example)
-        if os.path.isdir(entry_path):
-            continue
+def entry_iterator():
+    """
+    Iterates over all entries, yielding the file name, the file path and the content of each entry.
+    """
 
-        # read entry
-        content = utils.read_text(entry_path)
+    # get all entries
+    entries = entry_files()
 
-        # yield
-        yield entry, entry_path, content
+    # read entries (reading many small files is I/O bound, threads can overlap it) and yield them in order as soon as
+    # they are read, while the remaining ones are still read
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        contents = executor.map(utils.read_text, [entry_path for _, entry_path in entries])
+        for (entry, entry_path), content in zip(entries, contents):
+            yield entry, entry_path, content
 
 
+@lru_cache(maxsize=None)
 def canonical_name(name):
     """
     Derives a canonical name from an actual name (suitable for file names, anchor names, ...)
+    Cached, because the same names (titles, developers, keywords, ...) are canonicalized repeatedly.
     """
     name = name.casefold()
-    name = name.replace('ö', 'o').replace('ä', 'a').replace('ü', 'u')
+    name = name.translate(canonical_name_umlauts)
     name = regex_sanitize_name.sub('', name)
     name = regex_sanitize_name_space_eater.sub('_', name)
     name = name.replace('_-_', '-')
@@ -83,7 +115,7 @@ def read_developers():
         for field in c.url_developer_fields:
             if field in dev:
                 content = dev[field]
-                if any(not (x.startswith('http://') or x.startswith('https://')) for x in content):
+                if not all(x.startswith(('http://', 'https://')) for x in content):
                     raise RuntimeError('Invalid URL in field "{}" in developer {}.'.format(field, dev['Name']))
 
     # convert to dictionary
@@ -173,7 +205,7 @@ def read_inspirations():
         for field in c.url_inspiration_fields:
             if field in inspiration:
                 content = inspiration[field]
-                if any(not (x.startswith('http://') or x.startswith('https://')) for x in content):
+                if not all(x.startswith(('http://', 'https://')) for x in content):
                     raise RuntimeError('Invalid URL in field "{}" in inspiration {}.'.format(field, inspiration['Name']))
 
     # convert to dictionary
@@ -225,22 +257,34 @@ def write_inspirations(inspirations):
     utils.write_text(c.inspirations_file, content)
 
 
-def read_entries():
+@lru_cache(maxsize=None)
+def entry_parser():
     """
-    Parses all entries and assembles interesting infos about them.
+    Creates the parse function for entries. Building the parser from the grammar is costly, so it is only done once
+    and then reused by read_entries and read_entry.
     """
-
-    # setup parser and transformer
     grammar_file = os.path.join(c.code_path, 'grammar_entries.lark')
     grammar = utils.read_text(grammar_file)
-    parse = osg_parse.create(grammar, osg_parse.EntryTransformer)
+    return osg_parse.create(grammar, osg_parse.EntryTransformer)
+
+
+def read_entries(contents=None):
+    """
+    Parses all entries and assembles interesting infos about them.
+    :param contents: optional, already read entries as tuples (file, path, content) like from entry_iterator
+    """
+
+    # get parser and transformer
+    parse = entry_parser()
 
     # a database of all important infos about the entries
     entries = []
 
     # iterate over all entries
     exception_happened = None
-    for file, _, content in entry_iterator():
+    if contents is None:
+        contents = entry_iterator()
+    for file, _, content in contents:
 
         if not content.endswith('\n'):
             content += '\n'
@@ -271,10 +315,8 @@ def read_entry(file):
     :return: the entry
     """
 
-    # setup parser and transformer
-    grammar_file = os.path.join(c.code_path, 'grammar_entries.lark')
-    grammar = utils.read_text(grammar_file)
-    parse = osg_parse.create(grammar, osg_parse.EntryTransformer)
+    # get parser and transformer
+    parse = entry_parser()
 
     # read entry file
     content = utils.read_text(os.path.join(c.entries_path, file))
@@ -305,8 +347,8 @@ def check_and_process_entry(entry):
     index = 0
     for e in entry:
         field = e[0]
-        while index < len(c.valid_fields) and field != c.valid_fields[index]:
-            index += 1
+        rank = valid_field_ranks.get(field, -1)
+        index = rank if rank >= index else len(c.valid_fields)
         if index == len(c.valid_fields):  # must be valid fields and must be in the right order
             message += 'Field "{}" either misspelled or in wrong order\n'.format(field)
 
@@ -339,11 +381,11 @@ def check_and_process_entry(entry):
     entry['Building'] = building
 
     # check canonical file name
-    file = entry['File']
-    canonical_file_name = canonical_name(entry['Title']) + '.md'
+    file_stem = entry['File'][:-3]  # without '.md'
+    canonical_file_stem = canonical_name(entry['Title'])
     # we also allow -X with X =2..9 as possible extension (because of duplicate canonical file names)
-    if canonical_file_name != file and canonical_file_name != file[:-5] + '.md':
-        message += 'file name should be {}\n'.format(canonical_file_name)
+    if canonical_file_stem != file_stem and canonical_file_stem != file_stem[:-2]:
+        message += 'file name should be {}.md\n'.format(canonical_file_stem)
 
     # check that fields without comments have no comments (i.e. are no Values)
     for field in c.fields_without_comments:
@@ -357,7 +399,7 @@ def check_and_process_entry(entry):
     for t in state:
         if t != 'beta' and t != 'mature' and not t.startswith('inactive since '):
             message += 'Unknown state "{}"'.format(t)
-    if 'beta' in state == 'mature' in state:
+    if ('beta' in state) == ('mature' in state):  # neither or both
         message += 'State must be one of <"beta", "mature">'
 
     # check urls
@@ -366,12 +408,12 @@ def check_and_process_entry(entry):
         for value in values:
             if value.startswith('<') and value.endswith('>'):
                 value = value[1:-1]
-            if not any(value.startswith(x) for x in c.valid_url_prefixes):
+            if not value.startswith(c.valid_url_prefixes):
                 message += 'URL "{}" in field "{}" does not start with a valid prefix'.format(value, field)
 
     # github/gitlab repositories should end on .git and should start with https
     for repo in entry.get('Code repository', []):
-        if any(repo.startswith(x) for x in ('@', '?')):
+        if repo.startswith(('@', '?')):
             continue
         repo = repo.split(' ')[0].strip()
         if any((x in repo for x in ('github', 'gitlab', 'git.tuxfamily', 'git.savannah'))):
@@ -384,8 +426,8 @@ def check_and_process_entry(entry):
     if 'Platform' in entry:
         index = 0
         for platform in entry['Platform']:
-            while index < len(c.valid_platforms) and platform != c.valid_platforms[index]:
-                index += 1
+            rank = valid_platform_ranks.get(platform, -1)
+            index = rank if rank >= index else len(c.valid_platforms)
             if index == len(c.valid_platforms):  # must be valid platforms and must be in that order
                 message += 'Platform tag "{}" either misspelled or in wrong order'.format(platform)
 
@@ -395,19 +437,19 @@ def check_and_process_entry(entry):
 
     # check for existence of at least one recommended keywords
     keywords = entry['Keyword']
-    if not any(keyword in keywords for keyword in c.recommended_keywords):
+    if recommended_keywords.isdisjoint(keywords):
         message += 'Entry contains no recommended keywords'
 
     # languages should be known
     languages = entry['Code language']
     for language in languages:
-        if language not in c.known_languages:
+        if language not in known_languages:
             message += 'Language "{}" is not a known code language. Misspelled or new?'.format(language)
 
     # licenses should be known
     licenses = entry['Code license']
     for license in licenses:
-        if license not in c.known_licenses:
+        if license not in known_licenses:
             message += 'License "{}" is not a known license. Misspelled or new?'.format(license)
 
     if message:
@@ -500,8 +542,8 @@ def create_entry_content(entry):
             entry[field] = sorted(values, key=sort_fun)
     # we also sort keywords, but first the recommend ones and then other ones
     keywords = entry['Keyword']
-    a = [x for x in keywords if x in c.recommended_keywords]
-    b = [x for x in keywords if x not in c.recommended_keywords]
+    a = [x for x in keywords if x in recommended_keywords]
+    b = [x for x in keywords if x not in recommended_keywords]
     entry['Keyword'] = sorted(a, key=sort_fun) + sorted(b, key=sort_fun)
 
     # now all properties are in the recommended order
@@ -546,7 +588,7 @@ def is_url(str):
     :param str:
     :return:
     """
-    if any(str.startswith(x) for x in c.valid_url_prefixes) and not ' ' in str:
+    if str.startswith(c.valid_url_prefixes) and not ' ' in str:
         return True
     return False
 
@@ -582,13 +624,13 @@ def git_repo(repo):
         return repo
 
     # generic (https://*.git) or (http://*.git) ending on git
-    if (repo.startswith('https://') or repo.startswith('http://')) and repo.endswith('.git'):
+    if repo.startswith(('https://', 'http://')) and repo.endswith('.git'):
         return repo
 
     # for all others we just check if they start with the typical urls of git services
-    services = ['https://git.tuxfamily.org/', 'http://git.pond.sub.org/', 'https://gitorious.org/',
-                'https://git.code.sf.net/p/']
-    if any(repo.startswith(service) for service in services):
+    services = ('https://git.tuxfamily.org/', 'http://git.pond.sub.org/', 'https://gitorious.org/',
+                'https://git.code.sf.net/p/')
+    if repo.startswith(services):
         return repo
 
     # the rest is not recognized as a git url
@@ -602,7 +644,7 @@ def svn_repo(repo):
 
     # we can just go for known providers of svn
     services = ('svn://', 'https://svn.code.sf.net/p/', 'http://svn.savannah.gnu.org/svn/', 'https://svn.icculus.org/', 'http://svn.icculus.org/', 'http://svn.uktrainsim.com/svn/', 'https://rpg.hamsterrepublic.com/source/wip')
-    if any(repo.startswith(service) for service in services):
+    if repo.startswith(services):
         return repo
 
     # not svn
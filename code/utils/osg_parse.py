@@ -2,7 +2,6 @@
 
 """
 
-from functools import partial
 import lark
 from utils import utils, constants as c
 
@@ -163,16 +162,17 @@ class Value(str):
         obj.comment = comment
         return obj
 
-def parse(parser, transformer, content):
-    tree = parser.parse(content)
-    value = transformer.transform(tree)
-    return value
-
-
 def create(grammar, Transformer):
-    parser = lark.Lark(grammar, debug=False, parser='lalr')
-    transformer = Transformer()
-    return partial(parse, parser, transformer)
+    """
+    Creates a parse function for a grammar. The LALR parser applies the transformer already while parsing (in a single
+    pass), no intermediate parse tree is built. The grammar analysis is cached (by lark, in the temp directory) so
+    that it is only done once and not on every start of a script.
+    :param grammar:
+    :param Transformer:
+    :return:
+    """
+    parser = lark.Lark(grammar, debug=False, parser='lalr', transformer=Transformer(), cache=True)
+    return parser.parse
 
 
 def read_and_parse(content_file: str, grammar_file: str, Transformer: lark.Transformer):
@@ -4,6 +4,7 @@ of the website.
 """
 
 import os
+from collections import Counter
 import numpy as np
 import matplotlib.pyplot as plt
 
@@ -31,13 +32,9 @@ def get_field_statistics(entries, field, sub_field=None, include_NA=True):
         elif include_NA:
             values.append('N/A')
 
-    # unique field content
-    unique_values = set(values)
-
-    # count occurrences and sort
-    values_stat = [(l, values.count(l)) for l in unique_values]
-    values_stat.sort(key=lambda x: str.casefold(x[0]))  # first sort by name
-    values_stat.sort(key=lambda x: -x[1])  # then sort by occurrence (highest occurrence first)
+    # count occurrences of unique field content and sort
+    values_stat = list(Counter(values).items())
+    values_stat.sort(key=lambda x: (-x[1], str.casefold(x[0])))  # by occurrence (highest first), then by name
 
     return values_stat
 
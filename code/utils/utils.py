@@ -2,6 +2,7 @@
 Utilities for the tools. Only depending on standard Python or third party modules.
 """
 
+import json
 import os
 import shutil
 import subprocess
@@ -38,6 +39,15 @@ def write_text(file, text):
         f.write(text)
 
 
+def write_json(file, data, indent=1):
+    """
+    Writes data as JSON into a text file (UTF-8 encoded), streaming it into the file instead of creating the whole text
+    in memory first.
+    """
+    with open(file, mode='w', encoding='utf-8') as f:
+        json.dump(data, f, indent=indent)
+
+
 def determine_archive_version_generic(name, leading_terms, trailing_terms):
     """
     Given an archive file name, tries to get version information. Generic version that can cut off leading and trailing
@@ -206,15 +216,15 @@ def git_clear_path(git_path):
     """
     Clears all in a path except the '.git' directory
     """
-    for item in os.listdir(git_path):
-        # ignore '.git
-        if item == '.git':
-            continue
-        item = os.path.join(git_path, item)
-        if os.path.isdir(item):
-            shutil.rmtree(item, onerror=handleRemoveReadonly)
-        else:
-            os.remove(item)
+    with os.scandir(git_path) as it:
+        for item in it:
+            # ignore '.git
+            if item.name == '.git':
+                continue
+            if item.is_dir():
+                shutil.rmtree(item.path, onerror=handleRemoveReadonly)
+            else:
+                os.remove(item.path)
 
 
 def recreate_directory(path):